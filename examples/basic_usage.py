@@ -9,6 +9,20 @@ import json
 
 import httpx
 
+try:
+    # Faster JSON decoding when available
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+
+def tool_content(result):
+    """Return a tool result's content, decoding it only if sent as a JSON string."""
+    content = result['content']
+    if isinstance(content, str):
+        return json_loads(content)
+    return content
+
 
 async def test_selenium_mcp():
     """Test the Selenium MCP server functionality."""
@@ -16,7 +30,14 @@ async def test_selenium_mcp():
     # MCP server URL (assuming it's running locally)
     mcp_url = "http://localhost:8000"
 
-    async with httpx.AsyncClient() as client:
+    # Reuse keep-alive connections across all tool calls
+    limits = httpx.Limits(
+        max_connections=10,
+        max_keepalive_connections=10,
+        keepalive_expiry=30
+    )
+
+    async with httpx.AsyncClient(limits=limits) as client:
 
         print("Testing Selenium MCP Server...")
 
@@ -41,69 +62,65 @@ async def test_selenium_mcp():
             print(f"✗ Navigation failed: {response.text}")
             return
 
-        # Test 2: Get page info
+        # Tests 2-4 only read from the loaded page, so run them concurrently
         print("\n2. Getting page information...")
+        print("3. Finding h1 element...")
+        print("4. Executing JavaScript...")
         page_info_payload = {
             "arguments": {}
         }
-
-        response = await client.post(
-            f"{mcp_url}/call/get_page_info",
-            json=page_info_payload,
-            timeout=10.0
-        )
-
-        if response.status_code == 200:
-            result = response.json()
-            page_info = json.loads(result['content'])
-            print(f"✓ Page title: {page_info.get('title', 'Unknown')}")
-            print(f"✓ Page URL: {page_info.get('url', 'Unknown')}")
-        else:
-            print(f"✗ Page info failed: {response.text}")
-
-        # Test 3: Find an element
-        print("\n3. Finding h1 element...")
         find_element_payload = {
             "arguments": {
                 "selector": "h1",
                 "by": "tag_name"
             }
         }
-
-        response = await client.post(
-            f"{mcp_url}/call/find_element",
-            json=find_element_payload,
-            timeout=10.0
-        )
-
-        if response.status_code == 200:
-            result = response.json()
-            element_info = json.loads(result['content'])
-            print(f"✓ Found element: {element_info.get('tag_name', 'Unknown')}")
-            print(f"✓ Element text: {element_info.get('text', 'No text')}")
-        else:
-            print(f"✗ Find element failed: {response.text}")
-
-        # Test 4: Execute JavaScript
-        print("\n4. Executing JavaScript...")
         js_payload = {
             "arguments": {
                 "script": "return document.title;"
             }
         }
 
-        response = await client.post(
-            f"{mcp_url}/call/execute_javascript",
-            json=js_payload,
-            timeout=10.0
+        page_info_response, find_element_response, js_response = await asyncio.gather(
+            client.post(
+                f"{mcp_url}/call/get_page_info",
+                json=page_info_payload,
+                timeout=10.0
+            ),
+            client.post(
+                f"{mcp_url}/call/find_element",
+                json=find_element_payload,
+                timeout=10.0
+            ),
+            client.post(
+                f"{mcp_url}/call/execute_javascript",
+                json=js_payload,
+                timeout=10.0
+            ),
         )
 
-        if response.status_code == 200:
-            result = response.json()
-            js_result = json.loads(result['content'])
+        if page_info_response.status_code == 200:
+            result = page_info_response.json()
+            page_info = tool_content(result)
+            print(f"✓ Page title: {page_info.get('title', 'Unknown')}")
+            print(f"✓ Page URL: {page_info.get('url', 'Unknown')}")
+        else:
+            print(f"✗ Page info failed: {page_info_response.text}")
+
+        if find_element_response.status_code == 200:
+            result = find_element_response.json()
+            element_info = tool_content(result)
+            print(f"✓ Found element: {element_info.get('tag_name', 'Unknown')}")
+            print(f"✓ Element text: {element_info.get('text', 'No text')}")
+        else:
+            print(f"✗ Find element failed: {find_element_response.text}")
+
+        if js_response.status_code == 200:
+            result = js_response.json()
+            js_result = tool_content(result)
             print(f"✓ JavaScript executed: {js_result.get('result', 'No result')}")
         else:
-            print(f"✗ JavaScript execution failed: {response.text}")
+            print(f"✗ JavaScript execution failed: {js_response.text}")
 
         # Test 5: Close browser
         print("\n5. Closing browser session...")
@@ -119,7 +136,7 @@ async def test_selenium_mcp():
 
         if response.status_code == 200:
             result = response.json()
-            close_result = json.loads(result['content'])
+            close_result = tool_content(result)
             print(f"✓ {close_result.get('message', 'Browser closed')}")
         else:
             print(f"✗ Close browser failed: {response.text}")
@@ -16,51 +16,59 @@ async def start_browserless():
     """Start browserless in a Docker container."""
     print("Starting browserless container...")
 
+    # One client serves the initial probe and the readiness poll
+    client = httpx.AsyncClient(timeout=2.0)
     try:
-        # Check if browserless is already running
-        async with httpx.AsyncClient() as client:
-            await client.get("http://localhost:3000/health", timeout=2.0)
+        try:
+            # Check if browserless is already running
+            await client.get("http://localhost:3000/health")
             print("✓ Browserless is already running")
             return None
-    except Exception:
-        pass
-
-    # Start browserless container
-    cmd = [
-        "docker", "run", "--rm", "-d",
-        "-p", "3000:3000",
-        "-e", "CONNECTION_TIMEOUT=30000",
-        "-e", "MAX_CONCURRENT_SESSIONS=5",
-        "--name", "selenium-test-browserless",
-        "browserless/chrome:latest"
-    ]
+        except Exception:
+            pass
+
+        # Start browserless container
+        cmd = [
+            "docker", "run", "--rm", "-d",
+            "-p", "3000:3000",
+            "-e", "CONNECTION_TIMEOUT=30000",
+            "-e", "MAX_CONCURRENT_SESSIONS=5",
+            "--name", "selenium-test-browserless",
+            "browserless/chrome:latest"
+        ]
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✓ Browserless container started")
-
-            # Wait for browserless to be ready
-            print("Waiting for browserless to be ready...")
-            for _ in range(30):  # 30 second timeout
-                try:
-                    async with httpx.AsyncClient() as client:
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                print("✓ Browserless container started")
+
+                # Wait for browserless to be ready
+                print("Waiting for browserless to be ready...")
+                # Exponential backoff (0.1s doubling, capped at 1s) within 30s overall,
+                # enough for a cold start that pulls the image and launches Chrome
+                deadline = time.monotonic() + 30.0
+                attempt = 0
+                while time.monotonic() < deadline:
+                    try:
                         response = await client.get("http://localhost:3000/health", timeout=1.0)
                         if response.status_code == 200:
                             print("✓ Browserless is ready")
                             return "selenium-test-browserless"
-                except Exception:
-                    pass
-                time.sleep(1)
-
-            print("✗ Browserless failed to start within timeout")
-            return None
-        else:
-            print(f"✗ Failed to start browserless: {result.stderr}")
+                    except Exception:
+                        pass
+                    await asyncio.sleep(min(1.0, 0.1 * 2 ** attempt))
+                    attempt += 1
+
+                print("✗ Browserless failed to start within timeout")
+                return None
+            else:
+                print(f"✗ Failed to start browserless: {result.stderr}")
+                return None
+        except Exception as e:
+            print(f"✗ Error starting browserless: {e}")
             return None
-    except Exception as e:
-        print(f"✗ Error starting browserless: {e}")
-        return None
+    finally:
+        await client.aclose()
 
 
 async def stop_browserless(container_name):
@@ -103,7 +111,7 @@ async def test_mcp_server():
         try:
             # Test 1: Create driver and navigate
             print("1. Creating browser session and navigating...")
-            driver = manager.create_driver(session_id)
+            driver = await manager.create_driver(session_id)
             driver.get("https://httpbin.org/html")
 
             # Test 2: Get page title
@@ -131,8 +139,9 @@ async def test_mcp_server():
             print(f"✗ Test failed: {e}")
 
         finally:
-            # Clean up
-            manager.close_driver(session_id)
+            # Clean up: quit every session, stop the idle sweep and release
+            # the shared connection pool
+            await manager.close_all()
 
     except Exception as e:
         print(f"✗ MCP server test failed: {e}")
@@ -5,13 +5,25 @@ Connects to browserless service via WebDriver protocol over TCP.
 """
 
 import asyncio
+import functools
 import os
-from typing import Any, Dict, Optional
-
+import pkgutil
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, TypeVar
+
+import urllib3
 from fastmcp import Context, FastMCP
 from pydantic import BaseModel, Field
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.client_config import AuthType, ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.ui import WebDriverWait
@@ -19,6 +31,79 @@ from selenium.webdriver.support.ui import WebDriverWait
 # Initialize FastMCP server
 mcp = FastMCP("selenium")
 
+# Locator strategy names accepted by ElementParams.by
+_BY_METHODS: Mapping[str, str] = MappingProxyType({
+    "css": By.CSS_SELECTOR,
+    "xpath": By.XPATH,
+    "id": By.ID,
+    "name": By.NAME,
+    "class_name": By.CLASS_NAME,
+    "tag_name": By.TAG_NAME,
+    "link_text": By.LINK_TEXT,
+    "partial_link_text": By.PARTIAL_LINK_TEXT
+})
+
+# Collects the ElementInfo fields for arguments[0] in a single WebDriver call.
+# Attributes go through Selenium's getAttribute atom, as WebElement.get_attribute()
+# does, so properties win (e.g. href and src come back as absolute URLs).
+_ELEMENT_INFO_SCRIPT = """
+const getAttribute = %s;
+const el = arguments[0];
+const attributes = {};
+for (const name of ["id", "class", "name", "href", "src"]) {
+    const value = getAttribute(el, name);
+    if (value) attributes[name] = value;
+}
+const rect = el.getBoundingClientRect();
+return {
+    tag_name: el.tagName.toLowerCase(),
+    text: el.innerText || "",
+    attributes: attributes,
+    // Page coordinates, matching WebElement.location
+    location: {x: Math.round(rect.x + window.scrollX), y: Math.round(rect.y + window.scrollY)},
+    size: {width: Math.round(rect.width), height: Math.round(rect.height)}
+};
+""" % pkgutil.get_data("selenium.webdriver.remote", "getAttribute.js").decode("utf8")
+
+# Locates an element by strategy name (unknown names fall back to CSS) and clicks it
+# if it is visible, enabled and not covered; returns false otherwise. HTMLElement.click()
+# fires only the click event, with no pointerdown/mousedown/mouseup before it.
+_CLICK_SCRIPT = """
+const [by, selector] = arguments;
+let el;
+switch (by) {
+    case "xpath":
+        el = document.evaluate(
+            selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+        break;
+    case "id": el = document.getElementById(selector); break;
+    case "name": el = document.getElementsByName(selector)[0]; break;
+    case "class_name": el = document.getElementsByClassName(selector)[0]; break;
+    case "tag_name": el = document.getElementsByTagName(selector)[0]; break;
+    default: el = document.querySelector(selector);
+}
+if (!el) throw new Error("no such element: " + selector);
+el.scrollIntoView({block: "center", inline: "center"});
+const rect = el.getBoundingClientRect();
+const hit = document.elementFromPoint(rect.x + rect.width / 2, rect.y + rect.height / 2);
+if (!rect.width || !rect.height || el.disabled || !hit || !el.contains(hit)) return false;
+el.click();
+return true;
+"""
+
+# Resolves with the page title and URL once the document has finished loading
+_PAGE_STATE_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const check = () => document.readyState === "complete"
+    ? done({title: document.title, url: location.href})
+    : setTimeout(check, 50);
+check();
+"""
+
+# Browserless specific browser arguments, applied to fresh options per session
+_BROWSERLESS_ARGUMENTS = ("--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu")
+
 
 # Pydantic Models for Request/Response Validation
 class NavigateParams(BaseModel):
@@ -86,92 +171,300 @@ class CloseResponse(BaseModel):
     message: str = Field(..., description="Status message")
 
 
+# Selenium calls block on HTTP round trips to browserless, so run them off the
+# event loop to keep concurrent sessions from stalling each other
+_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="selenium")
+
+
+async def _run(fn, *args, **kwargs):
+    """Run a blocking callable in the Selenium thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
+
+
+@dataclass(frozen=True)
+class Config:
+    """Server configuration read from the environment."""
+    browserless_url: str
+    auth_token: Optional[str] = None
+    max_sessions: int = 10
+    idle_timeout: float = 600.0
+    http_pool_size: int = 20
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build the configuration from environment variables."""
+        browserless_url = os.getenv("BROWSERLESS_URL")
+        if not browserless_url:
+            raise ValueError("BROWSERLESS_URL environment variable is required")
+
+        return cls(
+            browserless_url=browserless_url,
+            # Optional authentication token
+            auth_token=os.getenv("BROWSERLESS_TOKEN") or None,
+            # Optional session bounds
+            max_sessions=_env_number("MAX_SESSIONS", cls.max_sessions),
+            idle_timeout=_env_number("SESSION_IDLE_TIMEOUT", cls.idle_timeout),
+            # Keep-alive connections to browserless for WebDriver commands
+            http_pool_size=_env_number("BROWSERLESS_HTTP_POOL", cls.http_pool_size),
+        )
+
+
+_Number = TypeVar("_Number", int, float)
+
+
+def _env_number(name: str, default: _Number) -> _Number:
+    """Parse a numeric environment variable of the default's type, naming it in any error."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return type(default)(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+
+
+class PooledRemoteConnection(RemoteConnection):
+    """Remote connection that shares one keep-alive pool across sessions."""
+
+    # Connection pools shared by every session so WebDriver commands reuse
+    # sockets, one per distinct pool configuration
+    _shared_pools: Dict[tuple, urllib3.PoolManager] = {}
+
+    def _get_connection_manager(self):
+        # Selenium builds the pool (proxy, SOCKS, certificates); only share it
+        config = self._client_config
+        key = (
+            config.timeout,
+            self._proxy_url,
+            config.ignore_certificates,
+            config.ca_certs,
+            repr(sorted(config.init_args_for_pool_manager.items())),
+        )
+        pool = PooledRemoteConnection._shared_pools.get(key)
+        if pool is None:
+            pool = super()._get_connection_manager()
+            PooledRemoteConnection._shared_pools[key] = pool
+        return pool
+
+    def close(self):
+        # Other sessions still use the shared pool; see close_pool()
+        pass
+
+    @classmethod
+    def close_pool(cls):
+        """Close the shared connection pools."""
+        pools = PooledRemoteConnection._shared_pools
+        while pools:
+            pools.popitem()[1].clear()
+
+
 class BrowserlessManager:
     """Manages browserless connections and sessions."""
 
-    def __init__(self, browserless_url: str, auth_token: Optional[str] = None):
+    # Seconds between background sweeps for idle sessions
+    reap_interval: float = 60.0
+
+    def __init__(
+        self,
+        browserless_url: str,
+        auth_token: Optional[str] = None,
+        max_sessions: int = Config.max_sessions,
+        idle_timeout: float = Config.idle_timeout,
+        http_pool_size: int = Config.http_pool_size,
+    ):
         self.browserless_url = browserless_url.rstrip('/')
         self.auth_token = auth_token
-        self.drivers: Dict[str, WebDriver] = {}
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.http_pool_size = http_pool_size
+        # Ordered least- to most-recently used
+        self.drivers: OrderedDict[str, WebDriver] = OrderedDict()
+        self.last_used: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # Guards max_sessions; _starting counts drivers not yet in self.drivers
+        self._slots = asyncio.Condition()
+        self._starting = 0
+        self._reaper: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_config(cls, cfg: Config) -> "BrowserlessManager":
+        """Create a manager from server configuration."""
+        return cls(
+            cfg.browserless_url,
+            cfg.auth_token,
+            cfg.max_sessions,
+            cfg.idle_timeout,
+            cfg.http_pool_size,
+        )
 
-    def create_driver(self, session_id: str, browser: str = "chrome") -> WebDriver:
-        """Create a new WebDriver instance connected to browserless."""
+    async def create_driver(self, session_id: str, browser: str = "chrome") -> WebDriver:
+        """Create a WebDriver instance connected to browserless for a session.
+
+        Concurrent calls for the same session share one driver; calls for
+        different sessions proceed in parallel.
+        """
+        async with self._lock_for(session_id):
+            driver = self.drivers.get(session_id)
+            if driver is None:
+                evicted = await self._reserve_slot()
+                try:
+                    await asyncio.gather(*(_run(self._quit, old) for old in evicted))
+                    driver = await _run(self._new_driver, browser)
+                    self.drivers[session_id] = driver
+                finally:
+                    await self._release_slot()
+            self._touch(session_id)
+            self._start_reaper()
+            return driver
+
+    async def _reserve_slot(self) -> List[WebDriver]:
+        """Claim room under max_sessions for a driver about to be started.
+
+        Runs on the event loop under a manager-wide condition, so concurrent
+        creations are counted before any of them finishes. Returns the least
+        recently used drivers detached to make room; the caller quits them.
+        """
+        evicted = []
+        async with self._slots:
+            while len(self.drivers) + self._starting >= self.max_sessions:
+                if not self.drivers:
+                    # Every slot is taken by a driver still starting up
+                    await self._slots.wait()
+                    continue
+                evicted.append(self._detach(next(iter(self.drivers))))
+            self._starting += 1
+        return evicted
+
+    async def _release_slot(self):
+        """Give back a slot claimed by _reserve_slot."""
+        async with self._slots:
+            self._starting -= 1
+            self._slots.notify()
+
+    def _new_driver(self, browser: str) -> WebDriver:
+        """Start a new browser session on browserless."""
         options = webdriver.ChromeOptions() if browser == "chrome" else webdriver.FirefoxOptions()
+        for argument in _BROWSERLESS_ARGUMENTS:
+            options.add_argument(argument)
+
+        # Size the HTTP pool so concurrent WebDriver commands reuse connections;
+        # RemoteConnection reads pool kwargs from this nested key
+        client_config = ClientConfig(
+            remote_server_addr=f"{self.browserless_url}/webdriver",
+            init_args_for_pool_manager={
+                "init_args_for_pool_manager": {"maxsize": self.http_pool_size},
+            },
+            # Sent as "Authorization: Bearer <token>" only when a token is set
+            auth_type=AuthType.BEARER,
+            token=self.auth_token,
+        )
 
-        # Browserless specific options
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-
-        # Connect to browserless with optional authentication
-        executor_url = f"{self.browserless_url}/webdriver"
-
-        if self.auth_token:
-            # Add authentication headers for browserless
-            from selenium.webdriver.remote.remote_connection import RemoteConnection
-
-            class AuthenticatedRemoteConnection(RemoteConnection):
-                def __init__(self, remote_server_addr, keep_alive=True, auth_token=None):
-                    super().__init__(remote_server_addr, keep_alive=keep_alive)
-                    self.auth_token = auth_token
-
-                def _get_connection_headers(self, parsed_url, keep_alive):
-                    headers = super()._get_connection_headers(parsed_url, keep_alive)
-                    if self.auth_token:
-                        headers["Authorization"] = f"Bearer {self.auth_token}"
-                    return headers
-
-            # Create custom command executor with authentication
-            driver = webdriver.Remote(
-                command_executor=AuthenticatedRemoteConnection(executor_url, auth_token=self.auth_token),
-                options=options
-            )
-        else:
-            # Standard connection without authentication
-            driver = webdriver.Remote(
-                command_executor=executor_url,
-                options=options
-            )
-
-        self.drivers[session_id] = driver
-        return driver
+        return webdriver.Remote(
+            command_executor=PooledRemoteConnection(client_config=client_config),
+            options=options,
+            client_config=client_config
+        )
 
-    def get_driver(self, session_id: str) -> Optional[WebDriver]:
+    async def get_driver(self, session_id: str) -> Optional[WebDriver]:
         """Get an existing WebDriver instance."""
-        return self.drivers.get(session_id)
+        driver = self.drivers.get(session_id)
+        if driver is not None:
+            self._touch(session_id)
+        return driver
 
-    def close_driver(self, session_id: str):
+    async def close_driver(self, session_id: str):
         """Close a WebDriver instance."""
-        if session_id in self.drivers:
-            try:
-                self.drivers[session_id].quit()
-            except Exception:
-                pass
-            del self.drivers[session_id]
-
-    def close_all(self):
-        """Close all WebDriver instances."""
-        for session_id in list(self.drivers.keys()):
-            self.close_driver(session_id)
-
-
-# Global browserless manager
-browserless_manager: Optional[BrowserlessManager] = None
+        # Wait for a create_driver still starting this session's browser
+        async with self._lock_for(session_id):
+            driver = self._detach(session_id)
+        self._drop_lock(session_id)
+        if driver is not None:
+            await _run(self._quit, driver)
+
+    def _detach(self, session_id: str) -> Optional[WebDriver]:
+        """Forget a session and return its driver, if any, without quitting it."""
+        self.last_used.pop(session_id, None)
+        self._drop_lock(session_id)
+        return self.drivers.pop(session_id, None)
+
+    async def evict_idle(self):
+        """Quit WebDriver instances unused for longer than idle_timeout."""
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [sid for sid, ts in self.last_used.items() if ts < cutoff]
+        drivers = [d for d in map(self._detach, idle) if d is not None]
+        await asyncio.gather(*(_run(self._quit, driver) for driver in drivers))
+
+    def _lock_for(self, session_id: str) -> asyncio.Lock:
+        """Get the lock serializing driver creation for a session."""
+        return self._locks.setdefault(session_id, asyncio.Lock())
+
+    def _drop_lock(self, session_id: str):
+        """Forget a closed session's lock unless it is still held."""
+        lock = self._locks.get(session_id)
+        if lock is not None and not lock.locked():
+            del self._locks[session_id]
+
+    def _touch(self, session_id: str):
+        """Mark a session as most recently used."""
+        self.drivers.move_to_end(session_id)
+        self.last_used[session_id] = time.monotonic()
+
+    def _start_reaper(self):
+        """Start the idle-session sweep unless it is already running."""
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_idle())
+
+    async def _reap_idle(self):
+        """Periodically evict idle sessions."""
+        while True:
+            await asyncio.sleep(self.reap_interval)
+            await self.evict_idle()
+
+    async def close_all(self):
+        """Close all WebDriver instances concurrently."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+
+        drivers = list(self.drivers.values())
+        self.drivers.clear()
+        self.last_used.clear()
+        self._locks.clear()
+        await asyncio.gather(*(_run(self._quit, driver) for driver in drivers))
+        PooledRemoteConnection.close_pool()
+
+    @staticmethod
+    def _quit(driver: WebDriver):
+        """Quit a WebDriver, ignoring sessions browserless already dropped."""
+        try:
+            driver.quit()
+        except (WebDriverException, ConnectionError, urllib3.exceptions.HTTPError):
+            pass
 
 
 def get_browserless_manager() -> BrowserlessManager:
     """Get or create browserless manager instance."""
-    global browserless_manager
-    if browserless_manager is None:
-        browserless_url = os.getenv("BROWSERLESS_URL")
-        if not browserless_url:
-            raise ValueError("BROWSERLESS_URL environment variable is required")
+    browserless_url = os.getenv("BROWSERLESS_URL")
+    if not browserless_url:
+        raise ValueError("BROWSERLESS_URL environment variable is required")
+    return _build(browserless_url)
 
-        # Get optional authentication token
-        auth_token = os.getenv("BROWSERLESS_TOKEN")
 
-        browserless_manager = BrowserlessManager(browserless_url, auth_token)
-    return browserless_manager
+# Unbounded: evicting a manager would orphan its drivers and reaper task
+@functools.lru_cache(maxsize=None)
+def _build(browserless_url: str) -> BrowserlessManager:
+    """Create one browserless manager per browserless URL."""
+    # The rest of the configuration is read once, when the manager is created
+    return BrowserlessManager.from_config(Config.from_env())
+
+
+async def _driver_for(ctx: Context) -> WebDriver:
+    """Get the WebDriver for the calling MCP session."""
+    driver = await get_browserless_manager().get_driver(ctx.session_id)
+    if not driver:
+        raise Exception("No active browser session. Please navigate to a URL first.")
+    return driver
 
 
 @mcp.resource("browser://{url}")
@@ -189,15 +482,16 @@ async def get_browser_content(url: str, ctx: Context) -> str:
     session_id = ctx.session_id
 
     try:
-        driver = manager.create_driver(session_id)
-        driver.get(url)
+        driver = await manager.create_driver(session_id)
+        await _run(driver.get, url)
 
         # Wait for page to load
-        WebDriverWait(driver, 10).until(
+        await _run(
+            WebDriverWait(driver, 10).until,
             ec.presence_of_element_located((By.TAG_NAME, "body"))
         )
 
-        return driver.page_source
+        return await _run(getattr, driver, "page_source")
 
     except Exception as e:
         raise Exception(f"Failed to get content from {url}: {str(e)}") from e
@@ -212,17 +506,18 @@ async def navigate_to_url(params: NavigateParams, ctx: Context) -> NavigateRespo
     session_id = ctx.session_id
 
     try:
-        driver = manager.get_driver(session_id) or manager.create_driver(session_id)
-        driver.get(params.url)
-
-        # Wait for page to load
-        WebDriverWait(driver, 10).until(
-            ec.presence_of_element_located((By.TAG_NAME, "body"))
+        driver = (
+            await manager.get_driver(session_id)
+            or await manager.create_driver(session_id)
         )
+        await _run(driver.get, params.url)
+
+        # Wait for page to load and read its state in one round trip
+        state = await _run(driver.execute_async_script, _PAGE_STATE_SCRIPT)
 
         return NavigateResponse(
-            title=driver.title,
-            current_url=driver.current_url,
+            title=state["title"],
+            current_url=state["url"],
             success=True
         )
 
@@ -235,37 +530,16 @@ async def find_element(params: ElementParams, ctx: Context) -> ElementInfo:
     """
     Find an element on the current page.
     """
-    manager = get_browserless_manager()
-    session_id = ctx.session_id
-
-    driver = manager.get_driver(session_id)
-    if not driver:
-        raise Exception("No active browser session. Please navigate to a URL first.")
+    driver = await _driver_for(ctx)
 
     try:
-        by_method = {
-            "css": By.CSS_SELECTOR,
-            "xpath": By.XPATH,
-            "id": By.ID,
-            "name": By.NAME,
-            "class_name": By.CLASS_NAME,
-            "tag_name": By.TAG_NAME,
-            "link_text": By.LINK_TEXT,
-            "partial_link_text": By.PARTIAL_LINK_TEXT
-        }.get(params.by.lower(), By.CSS_SELECTOR)
-
-        element = driver.find_element(by_method, params.selector)
+        by_method = _BY_METHODS.get(params.by.lower(), By.CSS_SELECTOR)
+
+        element = await _run(driver.find_element, by_method, params.selector)
 
+        # Read every field in one round trip instead of one per property
         return ElementInfo(
-            tag_name=element.tag_name,
-            text=element.text,
-            attributes={
-                attr: element.get_attribute(attr)
-                for attr in ["id", "class", "name", "href", "src"]
-                if element.get_attribute(attr)
-            },
-            location=element.location,
-            size=element.size
+            **await _run(driver.execute_script, _ELEMENT_INFO_SCRIPT, element)
         )
 
     except Exception as e:
@@ -277,37 +551,29 @@ async def click_element(params: ElementParams, ctx: Context) -> ClickResponse:
     """
     Click on an element on the current page.
     """
-    manager = get_browserless_manager()
-    session_id = ctx.session_id
-
-    driver = manager.get_driver(session_id)
-    if not driver:
-        raise Exception("No active browser session. Please navigate to a URL first.")
+    driver = await _driver_for(ctx)
 
     try:
-        by_method = {
-            "css": By.CSS_SELECTOR,
-            "xpath": By.XPATH,
-            "id": By.ID,
-            "name": By.NAME,
-            "class_name": By.CLASS_NAME,
-            "tag_name": By.TAG_NAME,
-            "link_text": By.LINK_TEXT,
-            "partial_link_text": By.PARTIAL_LINK_TEXT
-        }.get(params.by.lower(), By.CSS_SELECTOR)
-
-        element = driver.find_element(by_method, params.selector)
-        element.click()
-
-        # Wait for potential navigation
-        WebDriverWait(driver, 5).until(
-            ec.presence_of_element_located((By.TAG_NAME, "body"))
+        by = params.by.lower()
+        # Locate and click in a single round trip when the element is plainly
+        # clickable; link text matching is awkward in JS, so it always falls back
+        clicked = by not in ("link_text", "partial_link_text") and await _run(
+            driver.execute_script, _CLICK_SCRIPT, by, params.selector
         )
+        if not clicked:
+            # WebDriver's click checks interactability and reports why it failed
+            element = await _run(
+                driver.find_element, _BY_METHODS.get(by, By.CSS_SELECTOR), params.selector
+            )
+            await _run(element.click)
+
+        # Wait for potential navigation and read the resulting page state
+        state = await _run(driver.execute_async_script, _PAGE_STATE_SCRIPT)
 
         return ClickResponse(
             success=True,
-            new_title=driver.title,
-            new_url=driver.current_url
+            new_title=state["title"],
+            new_url=state["url"]
         )
 
     except Exception as e:
@@ -319,15 +585,10 @@ async def execute_javascript(params: ScriptParams, ctx: Context) -> ScriptRespon
     """
     Execute JavaScript in the current page context.
     """
-    manager = get_browserless_manager()
-    session_id = ctx.session_id
-
-    driver = manager.get_driver(session_id)
-    if not driver:
-        raise Exception("No active browser session. Please navigate to a URL first.")
+    driver = await _driver_for(ctx)
 
     try:
-        result = driver.execute_script(params.script)
+        result = await _run(driver.execute_script, params.script)
         return ScriptResponse(
             success=True,
             result=result
@@ -342,15 +603,12 @@ async def take_screenshot(ctx: Context) -> ScreenshotResponse:
     """
     Take a screenshot of the current page.
     """
-    manager = get_browserless_manager()
-    session_id = ctx.session_id
-
-    driver = manager.get_driver(session_id)
-    if not driver:
-        raise Exception("No active browser session. Please navigate to a URL first.")
+    driver = await _driver_for(ctx)
 
     try:
-        screenshot = driver.get_screenshot_as_base64()
+        # WebDriver already transfers screenshots as base64, so use the wire
+        # payload as-is rather than decoding to PNG bytes and re-encoding
+        screenshot = await _run(driver.get_screenshot_as_base64)
         return ScreenshotResponse(
             screenshot=f"data:image/png;base64,{screenshot}",
             success=True
@@ -368,7 +626,7 @@ async def close_browser(ctx: Context) -> CloseResponse:
     manager = get_browserless_manager()
     session_id = ctx.session_id
 
-    manager.close_driver(session_id)
+    await manager.close_driver(session_id)
     return CloseResponse(success=True, message="Browser session closed")
 
 
@@ -377,19 +635,18 @@ async def get_page_info(ctx: Context) -> PageInfo:
     """
     Get information about the current page.
     """
-    manager = get_browserless_manager()
-    session_id = ctx.session_id
-
-    driver = manager.get_driver(session_id)
-    if not driver:
-        raise Exception("No active browser session. Please navigate to a URL first.")
+    driver = await _driver_for(ctx)
 
     try:
         return PageInfo(
-            title=driver.title,
-            url=driver.current_url,
-            page_source_length=len(driver.page_source),
-            window_handle=driver.current_window_handle
+            title=await _run(getattr, driver, "title"),
+            url=await _run(getattr, driver, "current_url"),
+            # Measure in the browser rather than transferring the whole DOM
+            page_source_length=await _run(
+                driver.execute_script,
+                "return document.documentElement.outerHTML.length"
+            ),
+            window_handle=await _run(getattr, driver, "current_window_handle")
         )
 
     except Exception as e:
@@ -399,18 +656,17 @@ async def get_page_info(ctx: Context) -> PageInfo:
 async def main():
     """Main entry point for the MCP server."""
     # Validate environment variable
-    if not os.getenv("BROWSERLESS_URL"):
-        print("Error: BROWSERLESS_URL environment variable is required")
+    try:
+        cfg = Config.from_env()
+    except ValueError as e:
+        print(f"Error: {e}")
         print("Example: BROWSERLESS_URL=http://browserless:3000")
         return
 
-    browserless_url = os.getenv("BROWSERLESS_URL")
-    auth_token = os.getenv("BROWSERLESS_TOKEN")
-
-    if auth_token:
-        print(f"Starting Selenium MCP Server connecting to {browserless_url} with authentication")
+    if cfg.auth_token:
+        print(f"Starting Selenium MCP Server connecting to {cfg.browserless_url} with authentication")
     else:
-        print(f"Starting Selenium MCP Server connecting to {browserless_url}")
+        print(f"Starting Selenium MCP Server connecting to {cfg.browserless_url}")
 
     await mcp.run()
 
@@ -1,7 +1,9 @@
 """Pytest configuration for Selenium MCP tests."""
 
+import asyncio
 import os
-from unittest.mock import patch
+from collections import deque
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -22,9 +24,104 @@ def mock_browserless_token():
 
 @pytest.fixture
 def clean_browserless_manager():
-    """Ensure browserless_manager is reset between tests."""
+    """Ensure the cached browserless manager is reset between tests."""
     import server
-    original = server.browserless_manager
-    server.browserless_manager = None
+    server._build.cache_clear()
     yield
-    server.browserless_manager = original
+    server._build.cache_clear()
+
+
+class MockPool:
+    """Hands out Mock instances that are reset and reused across tests.
+
+    Plain Mock rather than MagicMock: reset_mock(return_value=True) wipes
+    MagicMock's magic-method defaults, leaving reused mocks with a broken
+    __bool__ and an __eq__ that is always truthy.
+    """
+
+    def __init__(self):
+        self._free = deque()
+        self._in_use = []
+
+    def acquire(self):
+        """Get a clean Mock, reusing a released one when available."""
+        mock = self._free.pop() if self._free else Mock()
+        self._in_use.append(mock)
+        return mock
+
+    def release_all(self, manager):
+        """Reset every acquired mock and return it to the pool.
+
+        Fails if the shared manager still holds one of them, since a later
+        test would find it in manager.drivers after it was handed out again.
+        """
+        held = {id(driver) for driver in manager.drivers.values()}
+        assert not any(id(mock) in held for mock in self._in_use), (
+            "pooled mock still referenced by the shared BrowserlessManager"
+        )
+        while self._in_use:
+            mock = self._in_use.pop()
+            mock.reset_mock(return_value=True, side_effect=True)
+            self._free.append(mock)
+
+
+@pytest.fixture(scope="session")
+def _mock_pool_store():
+    """Session-wide storage backing the mock_pool fixture."""
+    return MockPool()
+
+
+@pytest.fixture
+def mock_pool(_mock_pool_store, _shared_manager):
+    """Pool of reusable Mocks, released at the end of each test.
+
+    reset_mock() clears calls, return values and side effects, but not
+    attributes assigned directly (e.g. ``ctx.session_id = "..."``); those
+    carry over to whichever test gets the mock next, so set every attribute
+    a test relies on rather than assuming it is unset.
+    """
+    yield _mock_pool_store
+    _mock_pool_store.release_all(_shared_manager)
+
+
+def _reset_manager(manager):
+    """Drop all session state from a shared BrowserlessManager."""
+    manager.drivers.clear()
+    manager.last_used.clear()
+
+
+def _assert_pristine(manager):
+    """Fail if a test left state other than sessions on a shared BrowserlessManager.
+
+    Tests that start drivers (and so the slot, lock and reaper machinery)
+    build their own manager instead of using the shared one.
+    """
+    from server import BrowserlessManager
+    fresh = vars(BrowserlessManager(manager.browserless_url))
+    for name, value in vars(manager).items():
+        if name in ("drivers", "last_used"):
+            continue
+        if isinstance(value, asyncio.Condition):
+            # Conditions only compare by identity; check it is not held instead
+            assert not value.locked(), f"shared manager left {name} held"
+            continue
+        assert name in fresh and value == fresh[name], (
+            f"shared manager left {name} changed: {value!r}"
+        )
+
+
+@pytest.fixture(scope="module")
+def _shared_manager():
+    """BrowserlessManager instance reused by the tests of one module."""
+    from server import BrowserlessManager
+    return BrowserlessManager("http://localhost:3000")
+
+
+@pytest.fixture
+def manager(_shared_manager, mock_pool):
+    """Shared BrowserlessManager, emptied before and after each test."""
+    # Depends on mock_pool so it is emptied before the pool checks it
+    _reset_manager(_shared_manager)
+    yield _shared_manager
+    _reset_manager(_shared_manager)
+    _assert_pristine(_shared_manager)
@@ -6,53 +6,92 @@ import os
 from unittest.mock import MagicMock, patch
 
 import pytest
+from selenium.webdriver.remote.client_config import AuthType, ClientConfig
 
-from server import BrowserlessManager
+from server import BrowserlessManager, PooledRemoteConnection
 
 
 class TestBrowserlessAuthentication:
     """Test browserless authentication functionality."""
 
     @patch('server.webdriver.Remote')
-    def test_create_driver_without_auth(self, mock_remote):
+    async def test_create_driver_without_auth(self, mock_remote):
         """Test driver creation without authentication."""
         manager = BrowserlessManager("http://localhost:3000")
         mock_driver = MagicMock()
         mock_remote.return_value = mock_driver
 
-        driver = manager.create_driver("test-session")
+        driver = await manager.create_driver("test-session")
 
         assert driver == mock_driver
         assert "test-session" in manager.drivers
         mock_remote.assert_called_once()
-        # Should use standard connection without custom executor
+        # Should use the pooled connection without authentication
         args, kwargs = mock_remote.call_args
         assert "command_executor" in kwargs
-        assert kwargs["command_executor"] == "http://localhost:3000/webdriver"
+        executor = kwargs["command_executor"]
+        assert isinstance(executor, PooledRemoteConnection)
+        assert executor._client_config.remote_server_addr == "http://localhost:3000/webdriver"
+        assert executor._client_config.get_auth_header() is None
+
+        await manager.close_all()
 
     @patch('server.webdriver.Remote')
-    @patch('server.webdriver.remote.remote_connection.RemoteConnection')
-    def test_create_driver_with_auth(self, mock_remote_connection, mock_remote):
+    async def test_create_driver_with_auth(self, mock_remote):
         """Test driver creation with authentication."""
         manager = BrowserlessManager("http://localhost:3000", "test-token-123")
         mock_driver = MagicMock()
         mock_remote.return_value = mock_driver
 
-        # Mock the custom connection class
-        mock_auth_connection = MagicMock()
-        mock_remote_connection.return_value = mock_auth_connection
-
-        driver = manager.create_driver("test-session")
+        driver = await manager.create_driver("test-session")
 
         assert driver == mock_driver
         assert "test-session" in manager.drivers
         mock_remote.assert_called_once()
 
-        # Should use custom authenticated connection
+        # Every WebDriver request should carry the bearer token
         args, kwargs = mock_remote.call_args
-        assert "command_executor" in kwargs
-        # Should be a custom connection instance, not a string URL
-        assert kwargs["command_executor"] != "http://localhost:3000/webdriver"
+        executor = kwargs["command_executor"]
+        assert executor._client_config.get_auth_header() == {
+            "Authorization": "Bearer test-token-123"
+        }
+
+        await manager.close_all()
+
+    def test_connections_share_pool(self):
+        """Test that pooled and authenticated connections reuse one pool."""
+        plain = PooledRemoteConnection(
+            client_config=ClientConfig(remote_server_addr="http://localhost:3000/webdriver")
+        )
+        authenticated = PooledRemoteConnection(
+            client_config=ClientConfig(
+                remote_server_addr="http://localhost:3000/webdriver",
+                auth_type=AuthType.BEARER,
+                token="test-token",
+            )
+        )
+
+        assert plain._conn is authenticated._conn
+
+        PooledRemoteConnection.close_pool()
+        assert PooledRemoteConnection._shared_pools == {}
+
+    def test_pool_keeps_connection_settings(self):
+        """Test that shared pools honour each config's certificate settings."""
+        verified = PooledRemoteConnection(
+            client_config=ClientConfig(remote_server_addr="https://localhost:3000/webdriver")
+        )
+        insecure = PooledRemoteConnection(
+            client_config=ClientConfig(
+                remote_server_addr="https://localhost:3000/webdriver",
+                ignore_certificates=True,
+            )
+        )
+
+        assert verified._conn is not insecure._conn
+        assert insecure._conn.connection_pool_kw["cert_reqs"] == "CERT_NONE"
+
+        PooledRemoteConnection.close_pool()
 
     def test_auth_token_storage(self):
         """Test that auth token is stored correctly."""
@@ -66,7 +105,7 @@ class TestBrowserlessAuthentication:
 
 
 @pytest.mark.asyncio
-async def test_get_browserless_manager_with_auth():
+async def test_get_browserless_manager_with_auth(clean_browserless_manager):
     """Test get_browserless_manager function with authentication."""
 
     # Test with authentication token
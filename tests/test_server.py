@@ -3,12 +3,41 @@ Tests for the Selenium MCP server.
 These tests require a running browserless instance.
 """
 
+import asyncio
 import os
-from unittest.mock import MagicMock, patch
+import time
+from unittest.mock import patch
 
 import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
 
-from server import BrowserlessManager, get_browserless_manager
+from server import (
+    BrowserlessManager,
+    Config,
+    ElementParams,
+    NavigateParams,
+    click_element,
+    find_element,
+    get_browserless_manager,
+    get_page_info,
+    navigate_to_url,
+)
+
+
+class _FakeDriver:
+    """Minimal WebDriver stand-in for the navigation logic tests."""
+
+    __slots__ = ("_gets",)
+
+    def get(self, url):
+        self._gets.append(url)
+
+    def execute_async_script(self, script):
+        return {"title": "Test Page", "url": self._gets[-1]}
+
+    def quit(self):
+        pass
 
 
 class TestBrowserlessManager:
@@ -21,113 +50,320 @@ class TestBrowserlessManager:
         assert manager.drivers == {}
 
     @patch('server.webdriver.Remote')
-    def test_create_driver(self, mock_remote):
+    async def test_create_driver(self, mock_remote, mock_pool):
         """Test driver creation."""
         manager = BrowserlessManager("http://localhost:3000")
-        mock_driver = MagicMock()
+        mock_driver = mock_pool.acquire()
         mock_remote.return_value = mock_driver
 
-        driver = manager.create_driver("test-session")
+        driver = await manager.create_driver("test-session")
 
         assert driver == mock_driver
         assert "test-session" in manager.drivers
         mock_remote.assert_called_once()
+        client_config = mock_remote.call_args.kwargs["client_config"]
+        pool_args = client_config.init_args_for_pool_manager["init_args_for_pool_manager"]
+        assert pool_args["maxsize"] == 20
 
-    def test_get_driver_existing(self):
-        """Test getting existing driver."""
+        await manager.close_all()
+
+    @patch('server.webdriver.Remote')
+    async def test_parallel_distinct_sessions_do_not_serialize(self, mock_remote, mock_pool):
+        """Test that driver creation only serializes within a session."""
         manager = BrowserlessManager("http://localhost:3000")
-        mock_driver = MagicMock()
+
+        def slow_remote(**kwargs):
+            time.sleep(0.1)
+            return mock_pool.acquire()
+
+        mock_remote.side_effect = slow_remote
+
+        start = time.monotonic()
+        await asyncio.gather(*(manager.create_driver(f"session{i}") for i in range(10)))
+        elapsed = time.monotonic() - start
+
+        assert len(manager.drivers) == 10
+        # Ten serialized creations would take at least a second
+        assert elapsed < 0.5
+
+        await manager.close_all()
+
+    @patch('server.webdriver.Remote')
+    async def test_concurrent_create_same_session_shares_driver(self, mock_remote, mock_pool):
+        """Test that concurrent creation for one session starts a single driver."""
+        manager = BrowserlessManager("http://localhost:3000")
+        mock_remote.return_value = mock_pool.acquire()
+
+        driver1, driver2 = await asyncio.gather(
+            manager.create_driver("test-session"),
+            manager.create_driver("test-session"),
+        )
+
+        assert driver1 is driver2
+        mock_remote.assert_called_once()
+
+        await manager.close_all()
+
+    async def test_get_driver_existing(self, manager, mock_pool):
+        """Test getting existing driver."""
+        mock_driver = mock_pool.acquire()
         manager.drivers["test-session"] = mock_driver
 
-        driver = manager.get_driver("test-session")
+        driver = await manager.get_driver("test-session")
         assert driver == mock_driver
 
-    def test_get_driver_nonexistent(self):
+    async def test_get_driver_nonexistent(self, manager):
         """Test getting non-existent driver."""
-        manager = BrowserlessManager("http://localhost:3000")
 
-        driver = manager.get_driver("nonexistent")
+        driver = await manager.get_driver("nonexistent")
         assert driver is None
 
-    def test_close_driver(self):
+    async def test_close_driver(self, manager, mock_pool):
         """Test closing driver."""
-        manager = BrowserlessManager("http://localhost:3000")
-        mock_driver = MagicMock()
+        mock_driver = mock_pool.acquire()
         manager.drivers["test-session"] = mock_driver
 
-        manager.close_driver("test-session")
+        await manager.close_driver("test-session")
         assert "test-session" not in manager.drivers
         mock_driver.quit.assert_called_once()
 
-    def test_close_all_drivers(self):
-        """Test closing all drivers."""
+    @patch('server.webdriver.Remote')
+    async def test_close_driver_waits_for_pending_create(self, mock_remote, mock_pool):
+        """Test that closing a session also closes a browser still being started."""
         manager = BrowserlessManager("http://localhost:3000")
+        mock_driver = mock_pool.acquire()
+
+        def slow_remote(**kwargs):
+            time.sleep(0.1)
+            return mock_driver
+
+        mock_remote.side_effect = slow_remote
+
+        create = asyncio.create_task(manager.create_driver("test-session"))
+        await asyncio.sleep(0.01)
+        await manager.close_driver("test-session")
+        await create
+
+        assert "test-session" not in manager.drivers
+        assert "test-session" not in manager._locks
+        mock_driver.quit.assert_called_once()
+
+        await manager.close_all()
 
-        mock_driver1 = MagicMock()
-        mock_driver2 = MagicMock()
+    async def test_close_driver_ignores_webdriver_errors(self, manager, mock_pool):
+        """Test closing a driver whose remote session is already gone."""
+        mock_driver = mock_pool.acquire()
+        mock_driver.quit.side_effect = WebDriverException("session deleted")
+        manager.drivers["test-session"] = mock_driver
+
+        await manager.close_driver("test-session")
+        assert "test-session" not in manager.drivers
+
+    async def test_close_all_drivers(self, manager, mock_pool):
+        """Test closing all drivers."""
+
+        mock_driver1 = mock_pool.acquire()
+        mock_driver2 = mock_pool.acquire()
         manager.drivers["session1"] = mock_driver1
         manager.drivers["session2"] = mock_driver2
 
-        manager.close_all()
+        await manager.close_all()
         assert manager.drivers == {}
         mock_driver1.quit.assert_called_once()
         mock_driver2.quit.assert_called_once()
 
+    @patch('server.webdriver.Remote')
+    async def test_create_driver_evicts_least_recently_used(self, mock_remote, mock_pool):
+        """Test that the session cap closes the least recently used driver."""
+        manager = BrowserlessManager("http://localhost:3000", max_sessions=2)
+        mock_remote.side_effect = [mock_pool.acquire() for _ in range(3)]
+
+        driver1 = await manager.create_driver("session1")
+        driver2 = await manager.create_driver("session2")
+        await manager.get_driver("session1")
+        driver3 = await manager.create_driver("session3")
+
+        assert list(manager.drivers) == ["session1", "session3"]
+        assert "session2" not in manager.last_used
+        driver1.quit.assert_not_called()
+        # The evicted browser is quit, never handed to another session
+        driver2.quit.assert_called_once()
+        assert driver3 is not driver2
+        assert mock_remote.call_count == 3
+
+        await manager.close_all()
+
+    @patch('server.webdriver.Remote')
+    async def test_concurrent_creates_respect_session_cap(self, mock_remote, mock_pool):
+        """Test that concurrent creations never exceed max_sessions."""
+        manager = BrowserlessManager("http://localhost:3000", max_sessions=3)
+        started = []
+
+        def slow_remote(**kwargs):
+            time.sleep(0.05)
+            driver = mock_pool.acquire()
+            started.append(driver)
+            return driver
+
+        mock_remote.side_effect = slow_remote
+
+        await asyncio.gather(*(manager.create_driver(f"session{i}") for i in range(8)))
+
+        assert len(manager.drivers) == 3
+        live = [d for d in started if not d.quit.called]
+        assert len(live) == 3
+
+        await manager.close_all()
+
+    async def test_evict_idle(self, mock_pool):
+        """Test that idle drivers are closed."""
+        manager = BrowserlessManager("http://localhost:3000", idle_timeout=60)
+        idle_driver = mock_pool.acquire()
+        active_driver = mock_pool.acquire()
+        manager.drivers["idle"] = idle_driver
+        manager.drivers["active"] = active_driver
+        manager.last_used["idle"] = time.monotonic() - 120
+        manager.last_used["active"] = time.monotonic()
+
+        await manager.evict_idle()
+
+        assert list(manager.drivers) == ["active"]
+        idle_driver.quit.assert_called_once()
+        active_driver.quit.assert_not_called()
+
 
 class TestMCPFunctions:
     """Test MCP server functions."""
 
+    @patch('server.webdriver.Remote')
+    @patch('server.get_browserless_manager')
+    async def test_navigate_to_url_new_session(self, mock_get_manager, mock_remote, mock_pool):
+        """Test that navigate_to_url starts a driver for a new session."""
+        manager = BrowserlessManager("http://localhost:3000")
+        mock_driver = _FakeDriver()
+        mock_driver._gets = []
+        mock_remote.return_value = mock_driver
+        mock_get_manager.return_value = manager
+        ctx = mock_pool.acquire()
+        ctx.session_id = "test-session"
+
+        response = await navigate_to_url(NavigateParams(url="https://example.com"), ctx)
+
+        assert response.title == "Test Page"
+        assert response.current_url == "https://example.com"
+        assert response.success
+        assert mock_driver._gets == ["https://example.com"]
+        assert manager.drivers["test-session"] is mock_driver
+        mock_remote.assert_called_once()
+
+        await manager.close_all()
+
+    @patch('server.webdriver.Remote')
+    @patch('server.get_browserless_manager')
+    async def test_navigate_to_url_existing_session(self, mock_get_manager, mock_remote, manager, mock_pool):
+        """Test that navigate_to_url reuses the session's driver."""
+        mock_driver = _FakeDriver()
+        mock_driver._gets = []
+        manager.drivers["test-session"] = mock_driver
+        mock_get_manager.return_value = manager
+        ctx = mock_pool.acquire()
+        ctx.session_id = "test-session"
+
+        response = await navigate_to_url(NavigateParams(url="https://example.com"), ctx)
+
+        # Should use the existing driver
+        assert response.title == "Test Page"
+        assert response.current_url == "https://example.com"
+        mock_remote.assert_not_called()
+        assert mock_driver._gets == ["https://example.com"]
+
+        await manager.close_all()
+
+    @patch('server.get_browserless_manager')
+    async def test_click_element_in_one_round_trip(self, mock_get_manager, manager, mock_pool):
+        """Test that a clickable element is clicked by the click script."""
+        mock_driver = mock_pool.acquire()
+        mock_driver.execute_script.return_value = True
+        mock_driver.execute_async_script.return_value = {"title": "Next", "url": "https://example.com/next"}
+        manager.drivers["test-session"] = mock_driver
+        mock_get_manager.return_value = manager
+        ctx = mock_pool.acquire()
+        ctx.session_id = "test-session"
+
+        response = await click_element(ElementParams(selector="#next"), ctx)
+
+        assert response.new_title == "Next"
+        assert response.new_url == "https://example.com/next"
+        mock_driver.find_element.assert_not_called()
+
+    @patch('server.get_browserless_manager')
+    async def test_click_element_falls_back_to_webdriver_click(self, mock_get_manager, manager, mock_pool):
+        """Test that hidden or covered elements are clicked through WebDriver."""
+        mock_driver = mock_pool.acquire()
+        mock_driver.execute_script.return_value = False
+        mock_driver.execute_async_script.return_value = {"title": "Page", "url": "https://example.com"}
+        manager.drivers["test-session"] = mock_driver
+        mock_get_manager.return_value = manager
+        ctx = mock_pool.acquire()
+        ctx.session_id = "test-session"
+
+        await click_element(ElementParams(selector="#covered"), ctx)
+
+        mock_driver.find_element.assert_called_once_with(By.CSS_SELECTOR, "#covered")
+        mock_driver.find_element.return_value.click.assert_called_once()
+
     @patch('server.get_browserless_manager')
-    async def test_navigate_to_url_logic(self, mock_get_manager):
-        """Test the navigation logic used by navigate_to_url function."""
-        # Mock manager and driver
-        mock_manager = MagicMock()
-        mock_driver = MagicMock()
-        mock_driver.title = "Test Page"
-        mock_driver.current_url = "https://example.com"
-        mock_manager.get_driver.return_value = None
-        mock_manager.create_driver.return_value = mock_driver
-        mock_get_manager.return_value = mock_manager
-
-        # Test the core logic that would be in navigate_to_url
-        session_id = "test-session"
-        url = "https://example.com"
-
-        driver = mock_manager.get_driver(session_id) or mock_manager.create_driver(session_id)
-        driver.get(url)
-
-        # Verify results
-        assert driver.title == "Test Page"
-        assert driver.current_url == "https://example.com"
-        mock_driver.get.assert_called_once_with("https://example.com")
+    async def test_find_element(self, mock_get_manager, manager, mock_pool):
+        """Test that find_element builds ElementInfo from the info script."""
+        mock_driver = mock_pool.acquire()
+        mock_driver.execute_script.return_value = {
+            "tag_name": "a",
+            "text": "Log in",
+            "attributes": {"id": "login", "href": "https://example.com/login"},
+            "location": {"x": 10, "y": 1200},
+            "size": {"width": 80, "height": 20},
+        }
+        manager.drivers["test-session"] = mock_driver
+        mock_get_manager.return_value = manager
+        ctx = mock_pool.acquire()
+        ctx.session_id = "test-session"
+
+        info = await find_element(ElementParams(selector="a.login"), ctx)
+
+        assert info.tag_name == "a"
+        assert info.text == "Log in"
+        assert info.attributes == {"id": "login", "href": "https://example.com/login"}
+        assert info.location == {"x": 10, "y": 1200}
+        assert info.size == {"width": 80, "height": 20}
+        mock_driver.find_element.assert_called_once_with(By.CSS_SELECTOR, "a.login")
+        script, element = mock_driver.execute_script.call_args.args
+        # Attributes are resolved like WebElement.get_attribute()
+        assert "PROPERTY_ALIASES" in script
+        assert element is mock_driver.find_element.return_value
 
     @patch('server.get_browserless_manager')
-    async def test_navigate_to_url_existing_session_logic(self, mock_get_manager):
-        """Test the navigation logic with existing session."""
-        # Mock manager and driver
-        mock_manager = MagicMock()
-        mock_driver = MagicMock()
-        mock_driver.title = "Test Page"
-        mock_driver.current_url = "https://example.com"
-        mock_manager.get_driver.return_value = mock_driver
-        mock_get_manager.return_value = mock_manager
-
-        # Test the core logic that would be in navigate_to_url
-        session_id = "test-session"
-        url = "https://example.com"
-
-        driver = mock_manager.get_driver(session_id) or mock_manager.create_driver(session_id)
-        driver.get(url)
-
-        # Verify results - should use existing driver
-        assert driver.title == "Test Page"
-        assert driver.current_url == "https://example.com"
-        mock_manager.create_driver.assert_not_called()
-        mock_driver.get.assert_called_once_with("https://example.com")
+    async def test_get_page_info(self, mock_get_manager, manager, mock_pool):
+        """Test that get_page_info reports the page state."""
+        mock_driver = mock_pool.acquire()
+        mock_driver.title = "Example"
+        mock_driver.current_url = "https://example.com/"
+        mock_driver.current_window_handle = "window-1"
+        mock_driver.execute_script.return_value = 1256
+        manager.drivers["test-session"] = mock_driver
+        mock_get_manager.return_value = manager
+        ctx = mock_pool.acquire()
+        ctx.session_id = "test-session"
+
+        info = await get_page_info(ctx)
+
+        assert info.title == "Example"
+        assert info.url == "https://example.com/"
+        assert info.page_source_length == 1256
+        assert info.window_handle == "window-1"
 
 
 @pytest.mark.asyncio
-async def test_get_browserless_manager():
+async def test_get_browserless_manager(clean_browserless_manager):
     """Test get_browserless_manager function."""
 
     # First call should create manager
@@ -140,6 +376,16 @@ async def test_get_browserless_manager():
         manager2 = get_browserless_manager()
         assert manager2 is manager1
 
+    # The remaining configuration is only read when the manager is built
+    with patch.dict(os.environ, {"BROWSERLESS_URL": "http://test:3000", "MAX_SESSIONS": "bad"}):
+        assert get_browserless_manager() is manager1
+
+    # A different browserless URL should get its own manager
+    with patch.dict(os.environ, {"BROWSERLESS_URL": "http://other:3000"}):
+        manager3 = get_browserless_manager()
+        assert manager3 is not manager1
+        assert manager3.browserless_url == "http://other:3000"
+
 
 @pytest.mark.asyncio
 async def test_get_browserless_manager_missing_env(clean_browserless_manager):
@@ -149,3 +395,25 @@ async def test_get_browserless_manager_missing_env(clean_browserless_manager):
     with patch.dict(os.environ, {}, clear=True):
         with pytest.raises(ValueError, match="BROWSERLESS_URL environment variable is required"):
             get_browserless_manager()
+
+
+def test_config_from_env():
+    """Test Config reads browserless settings from the environment."""
+    with patch.dict(os.environ, {
+        "BROWSERLESS_URL": "http://test:3000",
+        "BROWSERLESS_TOKEN": "",
+        "MAX_SESSIONS": "3",
+    }):
+        cfg = Config.from_env()
+
+    assert cfg.browserless_url == "http://test:3000"
+    assert cfg.auth_token is None
+    assert cfg.max_sessions == 3
+    assert cfg.idle_timeout == 600.0
+
+
+def test_config_from_env_invalid_number():
+    """Test Config names the malformed numeric setting."""
+    with patch.dict(os.environ, {"BROWSERLESS_URL": "http://test:3000", "MAX_SESSIONS": "abc"}):
+        with pytest.raises(ValueError, match="MAX_SESSIONS must be a number"):
+            Config.from_env()